@@ -55,6 +55,8 @@ from .createmarketoperations import create_market_instruction_builder as create_
 from .createmarketoperations import create_market_operations as create_market_operations
 from .encoding import decode_binary as decode_binary
 from .encoding import encode_binary as encode_binary
+from .encoding import fast_b58decode as fast_b58decode
+from .encoding import fast_b58encode as fast_b58encode
 from .encoding import encode_key as encode_key
 from .encoding import encode_int as encode_int
 from .ensuremarketloaded import ensure_market_loaded as ensure_market_loaded
@@ -178,6 +180,7 @@ from .perpopenorders import PerpOpenOrders as PerpOpenOrders
 from .placedorder import PlacedOrder as PlacedOrder
 from .placedorder import PlacedOrdersContainer as PlacedOrdersContainer
 from .publickey import encode_public_key_for_sorting as encode_public_key_for_sorting
+from .publickey import public_key_as_str as public_key_as_str
 from .reconnectingwebsocket import ReconnectingWebsocket as ReconnectingWebsocket
 from .retrier import RetryWithPauses as RetryWithPauses
 from .retrier import retry_context as retry_context
@@ -34,6 +34,7 @@ from .orders import Side
 from .perpaccount import PerpAccount
 from .perpopenorders import PerpOpenOrders
 from .placedorder import PlacedOrder
+from .publickey import public_key_as_str
 from .token import Instrument, Token
 from .tokenbank import TokenBank
 from .version import Version
@@ -335,6 +336,26 @@ class Account(AddressableAccount):
             accounts += [account]
         return accounts
 
+    @staticmethod
+    def load_all_for_owners(context: Context, owners: typing.Sequence[PublicKey], group: Group) -> typing.Dict[str, typing.Sequence["Account"]]:
+        # getProgramAccounts is the most expensive RPC call there is - the node scans the
+        # whole program's accounts server-side - so issuing one per owner (as a loop over
+        # load_all_for_owner() would) multiplies that cost by the number of owners. For
+        # more than a couple of owners it's cheaper to fetch every account in the group
+        # once and split them up by owner client-side. The result maps each owner's
+        # address (as a string, since PublicKey isn't hashable) to that owner's accounts;
+        # owners with no accounts map to an empty sequence.
+        if len(owners) == 1:
+            return {public_key_as_str(owners[0]): Account.load_all_for_owner(context, owners[0], group)}
+
+        accounts_by_owner: typing.Dict[str, typing.List[Account]] = {
+            public_key_as_str(owner): [] for owner in owners}
+        for account in Account.load_all(context, group):
+            bucket: typing.Optional[typing.List[Account]] = accounts_by_owner.get(public_key_as_str(account.owner))
+            if bucket is not None:
+                bucket += [account]
+        return typing.cast(typing.Dict[str, typing.Sequence[Account]], accounts_by_owner)
+
     @staticmethod
     def load_for_owner_by_address(context: Context, owner: PublicKey, group: Group, account_address: typing.Optional[PublicKey]) -> "Account":
         if account_address is not None:
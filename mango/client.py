@@ -19,6 +19,7 @@ import logging
 import requests
 import time
 import typing
+import websocket
 
 
 from base64 import b64decode, b64encode
@@ -299,6 +300,16 @@ class RPCCaller(HTTPProvider):
         self.slot_holder: SlotHolder = slot_holder
         self.instruction_reporter: InstructionReporter = instruction_reporter
 
+        # A plain requests.post() opens (and tears down) a fresh TCP+TLS connection per
+        # call. A Session with a pooling adapter keeps connections to the RPC node alive,
+        # saving a round-trip plus the TLS handshake on every request after the first.
+        # Retries are left to our own error handling, not the adapter's.
+        adapter: requests.adapters.HTTPAdapter = requests.adapters.HTTPAdapter(
+            pool_connections=16, pool_maxsize=64, max_retries=0)
+        self.session: requests.Session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
     def require_data_from_fresh_slot(self, latest_slot: typing.Optional[int] = None) -> None:
         self.slot_holder.require_data_from_fresh_slot(latest_slot)
 
@@ -336,6 +347,70 @@ class RPCCaller(HTTPProvider):
         # They've all failed.
         raise last_stale_slot_exception
 
+    def make_batch_request(self, method: RPCMethod, params_list: typing.Sequence[typing.Sequence[typing.Any]]) -> typing.Sequence[RPCResponse]:
+        # Same stale-data pause-and-retry treatment as make_request() - a batch that
+        # returns data from a too-old slot is retried as a whole.
+        if len(self.stale_data_pauses_before_retry) == 0:
+            return self.__make_batch_request(method, params_list)
+
+        last_stale_slot_exception: StaleSlotException
+        for pause in [*self.stale_data_pauses_before_retry, 0]:
+            try:
+                return self.__make_batch_request(method, params_list)
+            except StaleSlotException as exception:
+                last_stale_slot_exception = exception
+                self._logger.debug(f"Will retry after pause of {pause} seconds after getting stale slot: {exception}")
+                time.sleep(pause)
+
+        # They've all failed.
+        raise last_stale_slot_exception
+
+    def __make_batch_request(self, method: RPCMethod, params_list: typing.Sequence[typing.Sequence[typing.Any]]) -> typing.Sequence[RPCResponse]:
+        # Pack multiple calls of the same method into a single HTTP POST using JSON-RPC 2.0
+        # batch semantics. The server may answer in any order, so responses are matched back
+        # to requests by their 'id' before returning. N calls collapse to one round-trip.
+        payload = [{"jsonrpc": "2.0", "id": counter, "method": method, "params": params}
+                   for counter, params in enumerate(params_list)]
+        raw_response = self.session.post(self.endpoint_uri,
+                                         headers={"Content-Type": "application/json"},
+                                         data=json.dumps(payload))
+
+        # "You will see HTTP respose codes 429 for too many requests or 413 for too much bandwidth."
+        if raw_response.status_code == 413:
+            raise TooMuchBandwidthRateLimitException(
+                f"Rate limited (too much bandwidth) calling method '{method}'.", self.name, self.cluster_url)
+        elif raw_response.status_code == 429:
+            raise TooManyRequestsRateLimitException(
+                f"Rate limited (too many requests) calling method '{method}'.", self.name, self.cluster_url)
+
+        raw_response.raise_for_status()
+
+        responses: typing.List[typing.Dict[str, typing.Any]] = json.loads(raw_response.text)
+        for response in responses:
+            if "error" in response:
+                error = response["error"]
+                error_message: str = error["message"] if "message" in error else "No message"
+                raise ClientException(
+                    f"Batched '{method}' failed: '{error_message}'", self.name, self.cluster_url)
+
+        responses.sort(key=lambda response: int(response["id"]))
+
+        # Batched responses get the same stale-slot check as single requests in
+        # __make_request() - each response's id is its index into params_list, so the
+        # commitment it was requested at is right there.
+        for response in responses:
+            params = params_list[int(response["id"])]
+            if len(params) > 1 and "commitment" in params[1] and params[1]["commitment"] == Processed:
+                if "result" in response and isinstance(response["result"], Mapping) and "context" in response["result"] and isinstance(response["result"]["context"], Mapping) and "slot" in response["result"]["context"]:
+                    slot: int = response["result"]["context"]["slot"]
+                    self._logger.debug(f"Batched {method}() data is from slot: {slot}")
+                    if not self.slot_holder.is_acceptable(slot):
+                        self._logger.warning(
+                            f"Result is from slot: {slot} - latest slot is: {self.slot_holder.latest_slot}")
+                        raise StaleSlotException(self.name, self.cluster_url, self.slot_holder.latest_slot, slot)
+
+        return typing.cast(typing.Sequence[RPCResponse], responses)
+
     def __make_request(self, method: RPCMethod, *params: typing.Any) -> RPCResponse:
         # This is the entire method in HTTPProvider that we're overriding here:
         #
@@ -345,7 +420,7 @@ class RPCCaller(HTTPProvider):
         # return self._after_request(raw_response=raw_response, method=method)
 
         request_kwargs = self._before_request(method=method, params=params, is_async=False)
-        raw_response = requests.post(**request_kwargs)
+        raw_response = self.session.post(**request_kwargs)
 
         # Some custom exceptions specifically for rate-limiting. This allows calling code to handle this
         # specific case if they so choose.
@@ -483,6 +558,28 @@ class CompoundRPCCaller(HTTPProvider):
 
         raise CompoundException(self.name, all_exceptions)
 
+    def make_batch_request(self, method: RPCMethod, params_list: typing.Sequence[typing.Sequence[typing.Any]]) -> typing.Sequence[RPCResponse]:
+        all_exceptions: typing.List[Exception] = []
+        for provider in self.__providers:
+            try:
+                result = provider.make_batch_request(method, params_list)
+                successful_index: int = self.__providers.index(provider)
+                if successful_index != 0:
+                    # Rebase the providers' list so we continue to use this successful one (until it fails)
+                    self.__providers = [*self.__providers[successful_index:], *self.__providers[:successful_index]]
+                    self.on_provider_change()
+                    self._logger.debug(f"Shifted provider - now using: {self.__providers[0]}")
+                return result
+            except (requests.exceptions.HTTPError,
+                    RateLimitException,
+                    NodeIsBehindException,
+                    StaleSlotException,
+                    FailedToFetchBlockhashException) as exception:
+                all_exceptions += [exception]
+                self._logger.info(f"Moving to next provider - {provider} gave {exception}")
+
+        raise CompoundException(self.name, all_exceptions)
+
     def is_connected(self) -> bool:
         # All we need for this to be true is for one of our providers to be connected.
         for provider in self.__providers:
@@ -530,6 +627,12 @@ class BetterClient:
         self.blockhash_cache_duration: int = blockhash_cache_duration
         self.rpc_caller: CompoundRPCCaller = rpc_caller
 
+        # A confirmed transaction is immutable, so once an RPC node has returned one there
+        # is no need to ever fetch it again. Bounded so a long-running process can't grow
+        # it without limit - the oldest entry is dropped once it's full.
+        self._confirmed_transaction_cache: typing.Dict[typing.Tuple[str, str], typing.Any] = {}
+        self._confirmed_transaction_cache_size: int = 512
+
     @staticmethod
     def from_configuration(name: str, cluster_name: str, cluster_urls: typing.Sequence[str], commitment: Commitment, skip_preflight: bool, encoding: str, blockhash_cache_duration: int, stale_data_pauses_before_retry: typing.Sequence[float], instruction_reporter: InstructionReporter) -> "BetterClient":
         slot_holder: SlotHolder = SlotHolder()
@@ -583,6 +686,15 @@ class BetterClient:
         value = Decimal(response["result"]["value"])
         return value / SOL_DECIMAL_DIVISOR
 
+    def get_balances(self, pubkeys: typing.Sequence[typing.Union[PublicKey, str]], commitment: Commitment = UnspecifiedCommitment) -> typing.Sequence[Decimal]:
+        # Fetch multiple SOL balances in a single round-trip by batching the getBalance calls
+        # into one JSON-RPC POST. Results are returned in the same order as `pubkeys`.
+        resolved_commitment, _ = self.__resolve_defaults(commitment)
+        params_list: typing.Sequence[typing.Sequence[typing.Any]] = [
+            [str(pubkey), {"commitment": resolved_commitment}] for pubkey in pubkeys]
+        responses = self.rpc_caller.make_batch_request(RPCMethod("getBalance"), params_list)
+        return [Decimal(response["result"]["value"]) / SOL_DECIMAL_DIVISOR for response in responses]
+
     def get_account_info(self, pubkey: typing.Union[PublicKey, str], commitment: Commitment = UnspecifiedCommitment,
                          encoding: str = UnspecifiedEncoding, data_slice: typing.Optional[DataSliceOpts] = None) -> typing.Any:
         resolved_commitment, resolved_encoding = self.__resolve_defaults(commitment, encoding)
@@ -595,8 +707,20 @@ class BetterClient:
 
     def get_confirmed_transaction(self, signature: str, encoding: str = "json") -> typing.Any:
         _, resolved_encoding = self.__resolve_defaults(None, encoding)
+        cache_key: typing.Tuple[str, str] = (signature, resolved_encoding)
+        cached: typing.Any = self._confirmed_transaction_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         response = self.compatible_client.get_confirmed_transaction(signature, resolved_encoding)
-        return response["result"]
+        result: typing.Any = response["result"]
+        if result is not None:
+            # Only successful (non-None) responses are cached - a not-yet-confirmed
+            # transaction may well be confirmed by the time of the next poll.
+            if len(self._confirmed_transaction_cache) >= self._confirmed_transaction_cache_size:
+                del self._confirmed_transaction_cache[next(iter(self._confirmed_transaction_cache))]
+            self._confirmed_transaction_cache[cache_key] = result
+        return result
 
     def get_minimum_balance_for_rent_exemption(self, size: int, commitment: Commitment = UnspecifiedCommitment) -> int:
         resolved_commitment, _ = self.__resolve_defaults(commitment)
@@ -688,6 +812,83 @@ class BetterClient:
 
     def wait_for_confirmation(self, transaction_ids: typing.Sequence[str], max_wait_in_seconds: int = 60) -> typing.Sequence[str]:
         self._logger.info(f"Waiting up to {max_wait_in_seconds} seconds for {transaction_ids}.")
+
+        # A signatureSubscribe notification is pushed as soon as the cluster sees the
+        # transaction at our commitment level, so this typically completes in about one
+        # slot rather than at the 1-second granularity of the polling loop (and without
+        # 60 get_confirmed_transaction round-trips per transaction).
+        subscribed = self.__wait_for_confirmation_by_subscription(transaction_ids, max_wait_in_seconds)
+        if subscribed is not None:
+            return subscribed
+
+        return self.__wait_for_confirmation_by_polling(transaction_ids, max_wait_in_seconds)
+
+    def __wait_for_confirmation_by_subscription(self, transaction_ids: typing.Sequence[str], max_wait_in_seconds: int) -> typing.Optional[typing.Sequence[str]]:
+        websocket_url: str = self.cluster_url.replace("https", "wss", 1)
+        if not websocket_url.startswith("wss"):
+            # Can't derive a secure websocket URL (for example a plain-HTTP localhost
+            # endpoint) - let the caller fall back to polling.
+            return None
+
+        start_time: datetime.datetime = datetime.datetime.now()
+        cutoff: datetime.datetime = start_time + datetime.timedelta(seconds=max_wait_in_seconds)
+        try:
+            ws = websocket.create_connection(websocket_url, timeout=max_wait_in_seconds)
+        except Exception as exception:
+            self._logger.warning(
+                f"Could not open websocket to {websocket_url} for signature subscription - falling back to polling: {exception}")
+            return None
+
+        all_confirmed: typing.List[str] = []
+        try:
+            pending_subscriptions: typing.Dict[int, str] = {}
+            active_subscriptions: typing.Dict[int, str] = {}
+            for counter, transaction_id in enumerate(transaction_ids):
+                pending_subscriptions[counter] = transaction_id
+                ws.send(json.dumps({
+                    "jsonrpc": "2.0",
+                    "id": counter,
+                    "method": "signatureSubscribe",
+                    "params": [transaction_id, {"commitment": str(self.commitment)}]
+                }))
+
+            while len(all_confirmed) < len(transaction_ids):
+                remaining: float = (cutoff - datetime.datetime.now()).total_seconds()
+                if remaining <= 0:
+                    self._logger.info(
+                        f"Timed out after {max_wait_in_seconds} seconds waiting on transactions {transaction_ids}.")
+                    break
+                ws.settimeout(remaining)
+                message: typing.Dict[str, typing.Any] = json.loads(ws.recv())
+                if "id" in message and "result" in message:
+                    # Response to one of our signatureSubscribe requests - remember which
+                    # subscription number belongs to which transaction.
+                    active_subscriptions[int(message["result"])] = pending_subscriptions[int(message["id"])]
+                elif message.get("method") == "signatureNotification":
+                    subscription: int = int(message["params"]["subscription"])
+                    confirmed_id: typing.Optional[str] = active_subscriptions.get(subscription)
+                    if confirmed_id is not None:
+                        self._logger.info(
+                            f"Confirmed {confirmed_id} after {datetime.datetime.now() - start_time} seconds.")
+                        all_confirmed += [confirmed_id]
+        except websocket.WebSocketTimeoutException:
+            # Nothing confirmed before the cutoff. That's a timeout, not a websocket
+            # failure - the time budget is spent, so don't hand the caller to the polling
+            # fallback for another full max_wait_in_seconds.
+            self._logger.info(
+                f"Timed out after {max_wait_in_seconds} seconds waiting on transactions {transaction_ids}.")
+        except Exception as exception:
+            if len(all_confirmed) == 0:
+                self._logger.warning(
+                    f"Websocket signature subscription failed - falling back to polling: {exception}")
+                return None
+            self._logger.warning(f"Websocket signature subscription interrupted: {exception}")
+        finally:
+            ws.close()
+
+        return all_confirmed
+
+    def __wait_for_confirmation_by_polling(self, transaction_ids: typing.Sequence[str], max_wait_in_seconds: int) -> typing.Sequence[str]:
         all_confirmed: typing.List[str] = []
         start_time: datetime.datetime = datetime.datetime.now()
         cutoff: datetime.datetime = start_time + datetime.timedelta(seconds=max_wait_in_seconds)
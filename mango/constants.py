@@ -98,7 +98,7 @@ THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLI
 #
 # This function provides a consistent way to determine the correct data path for use throughout `mango-explorer`.
 #
-def _build_data_path() -> str:
+def _build_data_path() -> typing.Tuple[str, typing.Any]:
     possibilities: typing.Sequence[str] = ["../data", "data", ".", "../../data", "../../../data"]
     attempts: typing.List[str] = []
     file_root: str = os.path.dirname(__file__)
@@ -108,8 +108,9 @@ def _build_data_path() -> str:
         try:
             attempted_ids_path: str = os.path.normpath(os.path.join(data_path, "ids.json"))
             with open(attempted_ids_path) as ids_file:
-                json.load(ids_file)
-                return data_path
+                # Probing for the data path already means parsing ids.json, so hand the
+                # parsed contents back too rather than loading the file a second time.
+                return data_path, json.load(ids_file)
         except:
             pass
 
@@ -120,15 +121,11 @@ def _build_data_path() -> str:
 #
 # This is the path to the data directory that contains (among other things) the ids.json.
 #
-DATA_PATH: str = _build_data_path()
-
-
 # ## MangoConstants
 #
-# Load all Mango Market's constants from its own `ids.json` file (retrieved from [GitHub](https://raw.githubusercontent.com/blockworks-foundation/mango-client-ts/main/src/ids.json).
+# All Mango Market's constants from its own `ids.json` file (retrieved from [GitHub](https://raw.githubusercontent.com/blockworks-foundation/mango-client-ts/main/src/ids.json).
 #
-with open(os.path.join(DATA_PATH, "ids.json")) as json_file:
-    MangoConstants = json.load(json_file)
+DATA_PATH, MangoConstants = _build_data_path()
 
 
 # # 🥭 PackageVersion class
@@ -13,8 +13,10 @@
 #   [Github](https://github.com/blockworks-foundation)
 #   [Email](mailto:hello@blockworks.foundation)
 
+import concurrent.futures
 import logging
 import multiprocessing
+import random
 import requests
 import time
 import typing
@@ -29,6 +31,7 @@ from .constants import MangoConstants
 from .instructionreporter import InstructionReporter, CompoundInstructionReporter
 from .instrumentlookup import InstrumentLookup
 from .marketlookup import MarketLookup
+from .publickey import public_key_as_str
 from .text import indent_collection_as_str, indent_item_by
 
 
@@ -37,6 +40,14 @@ from .text import indent_collection_as_str, indent_item_by
 # A `Context` object to manage Solana connection and Mango configuration.
 #
 class Context:
+    # Contexts can be created per group (or per market) by busy processes, and without
+    # __slots__ each instance drags a full attribute dict along. Slots drop that overhead
+    # and make attribute access a fixed-offset load instead of a dict probe.
+    __slots__ = ("_logger", "name", "client", "mango_program_address", "serum_program_address",
+                 "group_name", "group_address", "gma_chunk_size", "gma_chunk_pause",
+                 "instrument_lookup", "market_lookup", "ping_interval", "_last_generated_client_id",
+                 "_group_names_by_address", "_str_cache", "_str_cache_client", "retry_attempts")
+
     def __init__(self, name: str, cluster_name: str, cluster_urls: typing.Sequence[str], skip_preflight: bool,
                  commitment: str, encoding: str, blockhash_cache_duration: int,
                  stale_data_pauses_before_retry: typing.Sequence[float], mango_program_address: PublicKey,
@@ -62,14 +73,56 @@ class Context:
 
         self._last_generated_client_id: int = 0
 
+        # Inverted group-name indexes, built on demand and keyed by cluster name (the
+        # cluster can change underneath us - see ContextBuilder.forced_to_devnet()).
+        self._group_names_by_address: typing.Dict[str, typing.Dict[str, str]] = {}
+
+        # Loggers like to print the Context at DEBUG level, and rebuilding the multi-line
+        # description on every call adds up. Everything in it is fixed at construction
+        # except the client, which ContextBuilder's forced_to_* helpers can replace - so
+        # remember which client the cached string was built from.
+        self._str_cache: typing.Optional[str] = None
+        self._str_cache_client: typing.Optional[BetterClient] = None
+
         # kangda said in Discord: https://discord.com/channels/791995070613159966/836239696467591186/847816026245693451
         # "I think you are better off doing 4,8,16,20,30"
-        self.retry_pauses: typing.Sequence[Decimal] = [Decimal(4), Decimal(
-            8), Decimal(16), Decimal(20), Decimal(30)]
+        #
+        # That fixed schedule had a catch though: when a shared RPC node degrades, every
+        # client that uses it retries in lockstep, hammering it again at exactly the same
+        # moments. Jittering an exponential schedule of the same rough magnitude spreads
+        # the retries out across clients.
+        self.retry_attempts: int = 5
+
+    def _backoff(self, attempt: int) -> Decimal:
+        # Exponential backoff (capped at 30 seconds) with jitter, roughly tracking the old
+        # 4, 8, 16, 20, 30 schedule in magnitude.
+        base: float = float(min(30, 2 ** (attempt + 2)))
+        return Decimal(random.uniform(base / 2, base * 1.5))
+
+    @property
+    def retry_pauses(self) -> typing.Sequence[Decimal]:
+        return [self._backoff(attempt) for attempt in range(self.retry_attempts)]
 
     def create_thread_pool_scheduler(self) -> ThreadPoolScheduler:
         return ThreadPoolScheduler(multiprocessing.cpu_count())
 
+    def fetch_concurrently(self, fetchers: typing.Sequence[typing.Callable[[], typing.Any]]) -> typing.Sequence[typing.Any]:
+        # Run independent (typically RPC-bound) fetches in parallel threads, returning
+        # their results in the same order as the fetchers. N independent round-trips then
+        # cost roughly one round-trip of wall-clock time instead of N. For example:
+        # ```
+        # balance, accounts = context.fetch_concurrently([
+        #     lambda: context.client.get_balance(address),
+        #     lambda: group.fetch_cache(context)])
+        # ```
+        # An exception from any fetcher is re-raised here, after all fetchers have run.
+        if len(fetchers) == 1:
+            return [fetchers[0]()]
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(fetchers) or 1) as executor:
+            futures = [executor.submit(fetcher) for fetcher in fetchers]
+            return [future.result() for future in futures]
+
     def generate_client_id(self) -> int:
         # Previously used a random client ID strategy, which may be appropriate for some people.
         #   9223372036854775807 is sys.maxsize for 64-bit systems, with a bit_length of 63.
@@ -84,24 +137,30 @@ class Context:
         #   and if you could use the same id generation scheme (unix time in ms) it would even work well with the UI :slight_smile:
         #
         # We go with the time in milliseconds. We get the time in nanoseconds and divide it by 1,000,000 to get
-        # the time in milliseconds.
+        # the time in milliseconds. (Floor division keeps it all in integers - no float conversion and
+        # rounding for every instruction.)
         #
         # But there's more! Because this can be called in a burst, for, say, a dozen orders all within the same
         # millisecond. And using duplicate client order IDs would be Bad. So we keep track of the last one we
         # sent, and we just add one if we get an identical value.
-        new_id: int = round(time.time_ns() / 1000000)
+        new_id: int = time.time_ns() // 1000000
         if new_id <= self._last_generated_client_id:
             new_id = self._last_generated_client_id + 1
         self._last_generated_client_id = new_id
         return new_id
 
     def lookup_group_name(self, group_address: PublicKey) -> str:
-        group_address_str = str(group_address)
-        for group in MangoConstants["groups"]:
-            if group["cluster"] == self.client.cluster_name and group["publicKey"] == group_address_str:
-                return str(group["name"])
+        # Repeatedly scanning every group in MangoConstants is O(N) per lookup, so invert
+        # the address-to-name mapping once per cluster and probe that instead.
+        cluster_name: str = self.client.cluster_name
+        names_by_address: typing.Optional[typing.Dict[str, str]] = self._group_names_by_address.get(cluster_name)
+        if names_by_address is None:
+            names_by_address = {str(group["publicKey"]): str(group["name"])
+                                for group in MangoConstants["groups"]
+                                if group["cluster"] == cluster_name}
+            self._group_names_by_address[cluster_name] = names_by_address
 
-        return "« Unknown Group »"
+        return names_by_address.get(public_key_as_str(group_address), "« Unknown Group »")
 
     def fetch_stats(self, url_suffix: str) -> typing.Sequence[typing.Any]:
         stats_url = f"https://mango-stats-v3.herokuapp.com/{url_suffix}"
@@ -109,8 +168,9 @@ class Context:
         return typing.cast(typing.Sequence[typing.Any], stats_response.json())
 
     def __str__(self) -> str:
-        cluster_urls: str = indent_item_by(indent_collection_as_str(self.client.cluster_urls))
-        return f"""« Context '{self.name}':
+        if self._str_cache is None or self._str_cache_client is not self.client:
+            cluster_urls: str = indent_item_by(indent_collection_as_str(self.client.cluster_urls))
+            self._str_cache = f"""« Context '{self.name}':
     Cluster Name: {self.client.cluster_name}
     Cluster URLs:
         {cluster_urls}
@@ -119,6 +179,8 @@ class Context:
     Mango Program Address: {self.mango_program_address}
     Serum Program Address: {self.serum_program_address}
 »"""
+            self._str_cache_client = self.client
+        return self._str_cache
 
     def __repr__(self) -> str:
         return f"{self}"
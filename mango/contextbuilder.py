@@ -31,6 +31,83 @@ from .marketlookup import CompoundMarketLookup, MarketLookup
 from .serummarketlookup import SerumMarketLookup
 
 
+# # 🥭 _GroupConfiguration class
+#
+# The ids.json addresses for one group, parsed into `PublicKey`s exactly once. Building a
+# `PublicKey` means a Base58 decode, and every `Context` construction used to redo that work
+# (plus a full walk of `MangoConstants["groups"]`) for the same handful of constant strings.
+#
+class _GroupConfiguration(typing.NamedTuple):
+    name: str
+    group_address: PublicKey
+    mango_program_address: PublicKey
+    serum_program_address: PublicKey
+
+
+# # 🥭 _ClusterConfiguration class
+#
+# All the groups in one cluster, keyed by uppercased group name, with the cluster's default
+# (first-listed) group picked out.
+#
+class _ClusterConfiguration(typing.NamedTuple):
+    default_group: _GroupConfiguration
+    groups: typing.Dict[str, _GroupConfiguration]
+
+
+_CLUSTER_CONFIGURATION_CACHE: typing.Dict[str, _ClusterConfiguration] = {}
+
+
+# The token-list and instrument-list files are read-only once loaded, and every lookup
+# built from the same file is interchangeable - so load each file once and share the
+# result, instead of re-reading the JSON for every Context construction.
+_FILE_LOOKUP_CACHE: typing.Dict[str, typing.Any] = {}
+
+
+def _cached_spl_token_lookup(filename: str) -> InstrumentLookup:
+    key: str = f"spl:{filename}"
+    if key not in _FILE_LOOKUP_CACHE:
+        _FILE_LOOKUP_CACHE[key] = SPLTokenLookup.load(filename)
+    return typing.cast(InstrumentLookup, _FILE_LOOKUP_CACHE[key])
+
+
+def _cached_non_spl_instrument_lookup(filename: str) -> InstrumentLookup:
+    key: str = f"non-spl:{filename}"
+    if key not in _FILE_LOOKUP_CACHE:
+        _FILE_LOOKUP_CACHE[key] = NonSPLInstrumentLookup.load(filename)
+    return typing.cast(InstrumentLookup, _FILE_LOOKUP_CACHE[key])
+
+
+def _cached_serum_market_lookup(serum_program_address: PublicKey, filename: str) -> SerumMarketLookup:
+    key: str = f"serum:{serum_program_address}:{filename}"
+    if key not in _FILE_LOOKUP_CACHE:
+        _FILE_LOOKUP_CACHE[key] = SerumMarketLookup.load(serum_program_address, filename)
+    return typing.cast(SerumMarketLookup, _FILE_LOOKUP_CACHE[key])
+
+
+def _cluster_configuration(cluster_name: str) -> _ClusterConfiguration:
+    cached: typing.Optional[_ClusterConfiguration] = _CLUSTER_CONFIGURATION_CACHE.get(cluster_name)
+    if cached is None:
+        groups: typing.Dict[str, _GroupConfiguration] = {}
+        default_group: typing.Optional[_GroupConfiguration] = None
+        for group_data in MangoConstants["groups"]:
+            if group_data["cluster"] == cluster_name:
+                group_configuration: _GroupConfiguration = _GroupConfiguration(
+                    group_data["name"],
+                    PublicKey(group_data["publicKey"]),
+                    PublicKey(group_data["mangoProgramId"]),
+                    PublicKey(group_data["serumProgramId"]))
+                groups[group_configuration.name.upper()] = group_configuration
+                if default_group is None:
+                    default_group = group_configuration
+
+        if default_group is None:
+            raise Exception(f"Could not find any groups in cluster '{cluster_name}'.")
+
+        cached = _ClusterConfiguration(default_group, groups)
+        _CLUSTER_CONFIGURATION_CACHE[cluster_name] = cached
+    return cached
+
+
 # # 🥭 ContextBuilder
 #
 # ## Environment Variables
@@ -41,7 +118,8 @@ from .serummarketlookup import SerumMarketLookup
 # The following environment variables are read:
 # * NAME
 # * CLUSTER
-# * CLUSTER_URL
+# * CLUSTER_URL (can be a comma-separated list of URLs, tried in order for failover like
+#   repeated --cluster-url parameters)
 # * GROUP_NAME
 # * GROUP_ADDRESS
 # * MANGO_PROGRAM_ADDRESS
@@ -135,36 +213,44 @@ class ContextBuilder:
     def default() -> Context:
         return ContextBuilder.build()
 
+    # Rebuilding a `Context` from scratch for a different group means reconstructing the
+    # `BetterClient` (and its blockhash cache and HTTP session) and re-reading all the
+    # token-list files. Only the group-dependent pieces actually change, so clone the
+    # existing `Context` and swap just those - the client and its connections are reused
+    # as-is.
     @staticmethod
     def from_group_name(context: Context, group_name: str) -> Context:
-        return ContextBuilder.build(context.name, context.client.cluster_name, context.client.cluster_urls,
-                                    context.client.skip_preflight, context.client.commitment,
-                                    context.client.encoding, context.client.blockhash_cache_duration,
-                                    context.client.stale_data_pauses_before_retry,
-                                    group_name, None, None, None,
-                                    context.gma_chunk_size, context.gma_chunk_pause,
-                                    SPLTokenLookup.DefaultDataFilepath)
+        cluster_name: str = context.client.cluster_name
+        group_configuration: typing.Optional[_GroupConfiguration] = _cluster_configuration(
+            cluster_name).groups.get(group_name.upper())
+        if group_configuration is None:
+            raise Exception(f"Could not find group named '{group_name}' in cluster '{cluster_name}'.")
 
-    @staticmethod
-    def forced_to_devnet(context: Context) -> Context:
-        cluster_name: str = "devnet"
-        cluster_url: str = MangoConstants["cluster_urls"][cluster_name]
         fresh_context = copy.copy(context)
-        fresh_context.client = BetterClient.from_configuration(context.name,
-                                                               cluster_name,
-                                                               [cluster_url],
-                                                               context.client.commitment,
-                                                               context.client.skip_preflight,
-                                                               context.client.encoding,
-                                                               context.client.blockhash_cache_duration,
-                                                               context.client.stale_data_pauses_before_retry,
-                                                               context.client.instruction_reporter)
+        fresh_context.group_name = group_configuration.name
+        fresh_context.group_address = group_configuration.group_address
+        fresh_context.mango_program_address = group_configuration.mango_program_address
+        fresh_context.serum_program_address = group_configuration.serum_program_address
+        fresh_context.instrument_lookup, fresh_context.market_lookup = ContextBuilder._build_lookups(
+            cluster_name, group_configuration.name, group_configuration.serum_program_address,
+            SPLTokenLookup.DefaultDataFilepath)
+
+        # The cached description embeds the group details but the client is unchanged, so
+        # the client-identity check in `Context.__str__` won't invalidate it - clear it here.
+        fresh_context._str_cache = None
 
         return fresh_context
 
+    @staticmethod
+    def forced_to_devnet(context: Context) -> Context:
+        return ContextBuilder._forced_to_cluster(context, "devnet")
+
     @staticmethod
     def forced_to_mainnet_beta(context: Context) -> Context:
-        cluster_name: str = "mainnet"
+        return ContextBuilder._forced_to_cluster(context, "mainnet")
+
+    @staticmethod
+    def _forced_to_cluster(context: Context, cluster_name: str) -> Context:
         cluster_url: str = MangoConstants["cluster_urls"][cluster_name]
         fresh_context = copy.copy(context)
         fresh_context.client = BetterClient.from_configuration(context.name,
@@ -200,10 +286,7 @@ class ContextBuilder:
 
         # Now that we have the actual cluster name, taking environment variables and defaults into account,
         # we can decide what we want as the default group.
-        for group_data in MangoConstants["groups"]:
-            if group_data["cluster"] == actual_cluster:
-                default_group_data = group_data
-                break
+        cluster_configuration: _ClusterConfiguration = _cluster_configuration(actual_cluster)
 
         actual_commitment: str = commitment or "processed"
         actual_encoding: str = encoding or "base64"
@@ -214,36 +297,45 @@ class ContextBuilder:
         if actual_cluster_urls is None or len(actual_cluster_urls) == 0:
             cluster_url_from_environment: typing.Optional[str] = os.environ.get("CLUSTER_URL")
             if cluster_url_from_environment is not None and cluster_url_from_environment != "":
-                actual_cluster_urls = [cluster_url_from_environment]
+                # Allow a comma-separated list so a single environment variable can provide
+                # the same RPC failover as repeated --cluster-url parameters.
+                actual_cluster_urls = [cluster_url.strip()
+                                       for cluster_url in cluster_url_from_environment.split(",")
+                                       if cluster_url.strip() != ""]
             else:
                 actual_cluster_urls = [MangoConstants["cluster_urls"][actual_cluster]]
 
         actual_skip_preflight: bool = skip_preflight
-        actual_group_name: str = group_name or os.environ.get("GROUP_NAME") or default_group_data["name"]
+        actual_group_name: str = group_name or os.environ.get("GROUP_NAME") or cluster_configuration.default_group.name
 
-        found_group_data: typing.Any = None
-        for group in MangoConstants["groups"]:
-            if group["cluster"] == actual_cluster and group["name"].upper() == actual_group_name.upper():
-                found_group_data = group
-
-        if found_group_data is None:
+        found_group_configuration: typing.Optional[_GroupConfiguration] = cluster_configuration.groups.get(
+            actual_group_name.upper())
+        if found_group_configuration is None:
             raise Exception(f"Could not find group named '{actual_group_name}' in cluster '{actual_cluster}'.")
 
         actual_group_address: PublicKey = group_address or __public_key_or_none(os.environ.get(
-            "GROUP_ADDRESS")) or PublicKey(found_group_data["publicKey"])
+            "GROUP_ADDRESS")) or found_group_configuration.group_address
         actual_program_address: PublicKey = program_address or __public_key_or_none(os.environ.get(
-            "MANGO_PROGRAM_ADDRESS")) or PublicKey(found_group_data["mangoProgramId"])
+            "MANGO_PROGRAM_ADDRESS")) or found_group_configuration.mango_program_address
         actual_serum_program_address: PublicKey = serum_program_address or __public_key_or_none(os.environ.get(
-            "SERUM_PROGRAM_ADDRESS")) or PublicKey(found_group_data["serumProgramId"])
+            "SERUM_PROGRAM_ADDRESS")) or found_group_configuration.serum_program_address
 
         actual_gma_chunk_size: Decimal = gma_chunk_size or Decimal(100)
         actual_gma_chunk_pause: Decimal = gma_chunk_pause or Decimal(0)
 
-        ids_json_token_lookup: InstrumentLookup = IdsJsonTokenLookup(actual_cluster, actual_group_name)
+        instrument_lookup, market_lookup = ContextBuilder._build_lookups(
+            actual_cluster, actual_group_name, actual_serum_program_address, token_filename)
+
+        return Context(actual_name, actual_cluster, actual_cluster_urls, actual_skip_preflight, actual_commitment, actual_encoding, actual_blockhash_cache_duration, actual_stale_data_pauses_before_retry, actual_program_address, actual_serum_program_address, actual_group_name, actual_group_address, actual_gma_chunk_size, actual_gma_chunk_pause, instrument_lookup, market_lookup)
+
+    @staticmethod
+    def _build_lookups(cluster_name: str, group_name: str, serum_program_address: PublicKey,
+                       token_filename: str) -> typing.Tuple[InstrumentLookup, MarketLookup]:
+        ids_json_token_lookup: InstrumentLookup = IdsJsonTokenLookup(cluster_name, group_name)
         instrument_lookup: InstrumentLookup = ids_json_token_lookup
         mainnet_overrides_filename = os.path.join(DATA_PATH, "overrides.tokenlist.json")
         devnet_overrides_filename = os.path.join(DATA_PATH, "overrides.tokenlist.devnet.json")
-        if actual_cluster == "mainnet":
+        if cluster_name == "mainnet":
             # 'Overrides' are for problematic situations.
             #
             # We want to be able to use the community-owned SPL Token Registry JSON file. It holds details
@@ -260,20 +352,20 @@ class ContextBuilder:
             #
             # 'Overrides' allows us to put the details we expect for 'ETH' into our loader, ahead of the SPL
             # JSON, so that our code and users can continue to use, for example, ETH/USDT, as they expect.
-            mainnet_overrides_token_lookup: InstrumentLookup = SPLTokenLookup.load(mainnet_overrides_filename)
-            mainnet_spl_token_lookup: InstrumentLookup = SPLTokenLookup.load(token_filename)
-            mainnet_non_spl_instrument_lookup: InstrumentLookup = NonSPLInstrumentLookup.load(
+            mainnet_overrides_token_lookup: InstrumentLookup = _cached_spl_token_lookup(mainnet_overrides_filename)
+            mainnet_spl_token_lookup: InstrumentLookup = _cached_spl_token_lookup(token_filename)
+            mainnet_non_spl_instrument_lookup: InstrumentLookup = _cached_non_spl_instrument_lookup(
                 NonSPLInstrumentLookup.DefaultMainnetDataFilepath)
             instrument_lookup = CompoundInstrumentLookup([
                 ids_json_token_lookup,
                 mainnet_overrides_token_lookup,
                 mainnet_non_spl_instrument_lookup,
                 mainnet_spl_token_lookup])
-        elif actual_cluster == "devnet":
-            devnet_overrides_token_lookup: InstrumentLookup = SPLTokenLookup.load(devnet_overrides_filename)
+        elif cluster_name == "devnet":
+            devnet_overrides_token_lookup: InstrumentLookup = _cached_spl_token_lookup(devnet_overrides_filename)
             devnet_token_filename = token_filename.rsplit('.', 1)[0] + ".devnet.json"
-            devnet_spl_token_lookup: InstrumentLookup = SPLTokenLookup.load(devnet_token_filename)
-            devnet_non_spl_instrument_lookup: InstrumentLookup = NonSPLInstrumentLookup.load(
+            devnet_spl_token_lookup: InstrumentLookup = _cached_spl_token_lookup(devnet_token_filename)
+            devnet_non_spl_instrument_lookup: InstrumentLookup = _cached_non_spl_instrument_lookup(
                 NonSPLInstrumentLookup.DefaultDevnetDataFilepath)
             instrument_lookup = CompoundInstrumentLookup([
                 ids_json_token_lookup,
@@ -281,27 +373,27 @@ class ContextBuilder:
                 devnet_non_spl_instrument_lookup,
                 devnet_spl_token_lookup])
 
-        ids_json_market_lookup: MarketLookup = IdsJsonMarketLookup(actual_cluster, instrument_lookup)
+        ids_json_market_lookup: MarketLookup = IdsJsonMarketLookup(cluster_name, instrument_lookup)
         all_market_lookup = ids_json_market_lookup
-        if actual_cluster == "mainnet":
-            mainnet_overrides_serum_market_lookup: SerumMarketLookup = SerumMarketLookup.load(
-                actual_serum_program_address, mainnet_overrides_filename)
-            mainnet_serum_market_lookup: SerumMarketLookup = SerumMarketLookup.load(
-                actual_serum_program_address, token_filename)
+        if cluster_name == "mainnet":
+            mainnet_overrides_serum_market_lookup: SerumMarketLookup = _cached_serum_market_lookup(
+                serum_program_address, mainnet_overrides_filename)
+            mainnet_serum_market_lookup: SerumMarketLookup = _cached_serum_market_lookup(
+                serum_program_address, token_filename)
             all_market_lookup = CompoundMarketLookup([
                 ids_json_market_lookup,
                 mainnet_overrides_serum_market_lookup,
                 mainnet_serum_market_lookup])
-        elif actual_cluster == "devnet":
-            devnet_overrides_serum_market_lookup: SerumMarketLookup = SerumMarketLookup.load(
-                actual_serum_program_address, devnet_overrides_filename)
+        elif cluster_name == "devnet":
+            devnet_overrides_serum_market_lookup: SerumMarketLookup = _cached_serum_market_lookup(
+                serum_program_address, devnet_overrides_filename)
             devnet_token_filename = token_filename.rsplit('.', 1)[0] + ".devnet.json"
-            devnet_serum_market_lookup: SerumMarketLookup = SerumMarketLookup.load(
-                actual_serum_program_address, devnet_token_filename)
+            devnet_serum_market_lookup: SerumMarketLookup = _cached_serum_market_lookup(
+                serum_program_address, devnet_token_filename)
             all_market_lookup = CompoundMarketLookup([
                 ids_json_market_lookup,
                 devnet_overrides_serum_market_lookup,
                 devnet_serum_market_lookup])
         market_lookup: MarketLookup = all_market_lookup
 
-        return Context(actual_name, actual_cluster, actual_cluster_urls, actual_skip_preflight, actual_commitment, actual_encoding, actual_blockhash_cache_duration, actual_stale_data_pauses_before_retry, actual_program_address, actual_serum_program_address, actual_group_name, actual_group_address, actual_gma_chunk_size, actual_gma_chunk_pause, instrument_lookup, market_lookup)
+        return instrument_lookup, market_lookup
@@ -23,6 +23,7 @@ from .instrumentlookup import InstrumentLookup
 from .market import Market
 from .marketlookup import MarketLookup
 from .perpmarket import PerpMarketStub
+from .publickey import public_key_as_str
 from .spotmarket import SpotMarketStub
 from .token import Instrument, Token
 
@@ -38,6 +39,19 @@ class IdsJsonMarketType(enum.Enum):
         return f"{self}"
 
 
+# # 🥭 _MarketEntry class
+#
+# A `_MarketEntry` captures everything needed to build a `Market` from one ids.json market
+# entry, so lookups can be simple dict probes instead of rescanning every group on every call.
+#
+class _MarketEntry(typing.NamedTuple):
+    market_type: IdsJsonMarketType
+    mango_program_address: PublicKey
+    group_address: PublicKey
+    data: typing.Dict[str, typing.Any]
+    quote_symbol: str
+
+
 # # 🥭 IdsJsonMarketLookup class
 #
 # This class allows us to look up market data from our ids.json configuration file.
@@ -50,6 +64,33 @@ class IdsJsonMarketLookup(MarketLookup):
         self.cluster_name: str = cluster_name
         self.instrument_lookup: InstrumentLookup = instrument_lookup
 
+        # Index the raw ids.json entries once here, so find_by_symbol() and find_by_address()
+        # are O(1) dict probes instead of rescanning (and re-parsing the addresses of) every
+        # group on every call. Building the actual `Market` is left until lookup time so a
+        # missing instrument only matters if that specific market is requested.
+        self._perp_entries_by_symbol: typing.Dict[str, _MarketEntry] = {}
+        self._spot_entries_by_symbol: typing.Dict[str, _MarketEntry] = {}
+        self._entries_by_address: typing.Dict[str, _MarketEntry] = {}
+        self._all_entries: typing.List[_MarketEntry] = []
+        for group in MangoConstants["groups"]:
+            if group["cluster"] == self.cluster_name:
+                group_address: PublicKey = PublicKey(group["publicKey"])
+                mango_program_address: PublicKey = PublicKey(group["mangoProgramId"])
+                quote_symbol: str = group["quoteSymbol"]
+                for market_type, markets_name in ((IdsJsonMarketType.PERP, "perpMarkets"), (IdsJsonMarketType.SPOT, "spotMarkets")):
+                    for market_data in group[markets_name]:
+                        entry: _MarketEntry = _MarketEntry(
+                            market_type, mango_program_address, group_address, market_data, quote_symbol)
+                        by_symbol = self._perp_entries_by_symbol if market_type == IdsJsonMarketType.PERP else self._spot_entries_by_symbol
+                        by_symbol.setdefault(market_data["name"].upper(), entry)
+                        self._entries_by_address.setdefault(market_data["publicKey"], entry)
+                        self._all_entries += [entry]
+
+    def _market_from_entry(self, entry: _MarketEntry) -> Market:
+        return IdsJsonMarketLookup._from_dict(entry.market_type, entry.mango_program_address,
+                                              entry.group_address, entry.data,
+                                              self.instrument_lookup, entry.quote_symbol)
+
     @staticmethod
     def _from_dict(market_type: IdsJsonMarketType, mango_program_address: PublicKey, group_address: PublicKey, data: typing.Dict[str, typing.Any], instrument_lookup: InstrumentLookup, quote_symbol: str) -> Market:
         base_symbol = data["baseSymbol"]
@@ -78,46 +119,21 @@ class IdsJsonMarketLookup(MarketLookup):
             symbol = symbol.split(":", 1)[1]
             check_spots = False  # Skip spot markets because we're explicitly told it's a perp
 
-        for group in MangoConstants["groups"]:
-            if group["cluster"] == self.cluster_name:
-                group_address: PublicKey = PublicKey(group["publicKey"])
-                mango_program_address: PublicKey = PublicKey(group["mangoProgramId"])
-                if check_perps:
-                    for market_data in group["perpMarkets"]:
-                        if market_data["name"].upper() == symbol.upper():
-                            return IdsJsonMarketLookup._from_dict(IdsJsonMarketType.PERP, mango_program_address, group_address, market_data, self.instrument_lookup, group["quoteSymbol"])
-                if check_spots:
-                    for market_data in group["spotMarkets"]:
-                        if market_data["name"].upper() == symbol.upper():
-                            return IdsJsonMarketLookup._from_dict(IdsJsonMarketType.SPOT, mango_program_address, group_address, market_data, self.instrument_lookup, group["quoteSymbol"])
+        if check_perps:
+            perp_entry: typing.Optional[_MarketEntry] = self._perp_entries_by_symbol.get(symbol)
+            if perp_entry is not None:
+                return self._market_from_entry(perp_entry)
+        if check_spots:
+            spot_entry: typing.Optional[_MarketEntry] = self._spot_entries_by_symbol.get(symbol)
+            if spot_entry is not None:
+                return self._market_from_entry(spot_entry)
         return None
 
     def find_by_address(self, address: PublicKey) -> typing.Optional[Market]:
-        for group in MangoConstants["groups"]:
-            if group["cluster"] == self.cluster_name:
-                group_address: PublicKey = PublicKey(group["publicKey"])
-                mango_program_address: PublicKey = PublicKey(group["mangoProgramId"])
-                for market_data in group["perpMarkets"]:
-                    if market_data["publicKey"] == str(address):
-                        return IdsJsonMarketLookup._from_dict(IdsJsonMarketType.PERP, mango_program_address, group_address, market_data, self.instrument_lookup, group["quoteSymbol"])
-                for market_data in group["spotMarkets"]:
-                    if market_data["publicKey"] == str(address):
-                        return IdsJsonMarketLookup._from_dict(IdsJsonMarketType.SPOT, mango_program_address, group_address, market_data, self.instrument_lookup, group["quoteSymbol"])
-        return None
+        entry: typing.Optional[_MarketEntry] = self._entries_by_address.get(public_key_as_str(address))
+        if entry is None:
+            return None
+        return self._market_from_entry(entry)
 
     def all_markets(self) -> typing.Sequence[Market]:
-        markets = []
-        for group in MangoConstants["groups"]:
-            if group["cluster"] == self.cluster_name:
-                group_address: PublicKey = PublicKey(group["publicKey"])
-                mango_program_address: PublicKey = PublicKey(group["mangoProgramId"])
-                for market_data in group["perpMarkets"]:
-                    market = IdsJsonMarketLookup._from_dict(
-                        IdsJsonMarketType.PERP, mango_program_address, group_address, market_data, self.instrument_lookup, group["quoteSymbol"])
-                    markets = [market]
-                for market_data in group["spotMarkets"]:
-                    market = IdsJsonMarketLookup._from_dict(
-                        IdsJsonMarketType.SPOT, mango_program_address, group_address, market_data, self.instrument_lookup, group["quoteSymbol"])
-                    markets = [market]
-
-        return markets
+        return [self._market_from_entry(entry) for entry in self._all_entries]
@@ -13,10 +13,30 @@
 #   [Github](https://github.com/blockworks-foundation)
 #   [Email](mailto:hello@blockworks.foundation)
 
+import functools
 import typing
 
 from solana.publickey import PublicKey
 
+from .encoding import fast_b58encode
+
+
+# # 🥭 public_key_as_str function
+#
+# Stringifying a `PublicKey` means Base58-encoding its 32 bytes, which is surprisingly
+# CPU-heavy to do over and over in lookup loops. The same few addresses tend to be
+# stringified again and again though, so a small cache pays for itself quickly.
+#
+# `PublicKey` isn't hashable so the `lru_cache` is keyed on the raw bytes instead.
+#
+@functools.lru_cache(maxsize=4096)
+def _public_key_bytes_as_str(raw: bytes) -> str:
+    return fast_b58encode(raw)
+
+
+def public_key_as_str(address: PublicKey) -> str:
+    return _public_key_bytes_as_str(bytes(address))
+
 
 # # 🥭 encode_public_key_for_sorting function
 #
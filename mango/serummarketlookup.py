@@ -55,22 +55,25 @@ class SerumMarketLookup(MarketLookup):
         self.serum_program_address: PublicKey = serum_program_address
         self.token_data: typing.Dict[str, typing.Any] = token_data
 
+        # The token list runs to thousands of entries and find_by_symbol() used to walk
+        # it once for the base token and again for the quote token, per call. Index the
+        # entries by symbol up front so each lookup is a single dict probe. Where the
+        # list holds duplicate symbols the first entry wins, matching the old scan.
+        self._token_data_by_symbol: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+        for token in token_data["tokens"]:
+            self._token_data_by_symbol.setdefault(token["symbol"], token)
+
     @staticmethod
     def load(serum_program_address: PublicKey, token_data_filename: str) -> "SerumMarketLookup":
         with open(token_data_filename, encoding="utf-8") as json_file:
             token_data = json.load(json_file)
             return SerumMarketLookup(serum_program_address, token_data)
 
-    @staticmethod
-    def _find_data_by_symbol(symbol: str, token_data: typing.Dict[str, typing.Any]) -> typing.Optional[typing.Dict[str, typing.Any]]:
-        for token in token_data["tokens"]:
-            if token["symbol"] == symbol:
-                return typing.cast(typing.Dict[str, typing.Any], token)
-        return None
+    def _find_data_by_symbol(self, symbol: str) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        return self._token_data_by_symbol.get(symbol)
 
-    @staticmethod
-    def _find_token_by_symbol_or_error(symbol: str, token_data: typing.Dict[str, typing.Any]) -> Token:
-        found_token_data = SerumMarketLookup._find_data_by_symbol(symbol, token_data)
+    def _find_token_by_symbol_or_error(self, symbol: str) -> Token:
+        found_token_data = self._find_data_by_symbol(symbol)
         if found_token_data is None:
             raise Exception(f"Could not find data for token symbol '{symbol}'.")
 
@@ -85,14 +88,14 @@ class SerumMarketLookup(MarketLookup):
             symbol = symbol.split(":", 1)[1]
 
         base_symbol, quote_symbol = symbol.split("/")
-        base_data = SerumMarketLookup._find_data_by_symbol(base_symbol, self.token_data)
+        base_data = self._find_data_by_symbol(base_symbol)
         if base_data is None:
             self._logger.warning(f"Could not find data for base token '{base_symbol}'")
             return None
         base = Token(base_data["symbol"], base_data["name"], Decimal(
             base_data["decimals"]), PublicKey(base_data["address"]))
 
-        quote_data = SerumMarketLookup._find_data_by_symbol(quote_symbol, self.token_data)
+        quote_data = self._find_data_by_symbol(quote_symbol)
         if quote_data is None:
             self._logger.warning(f"Could not find data for quote token '{quote_symbol}'")
             return None
@@ -134,7 +137,7 @@ class SerumMarketLookup(MarketLookup):
                         market_address = PublicKey(market_address_string)
                         base = Token(token_data["symbol"], token_data["name"], Decimal(
                             token_data["decimals"]), PublicKey(token_data["address"]))
-                        quote_data = SerumMarketLookup._find_data_by_symbol("USDC", self.token_data)
+                        quote_data = self._find_data_by_symbol("USDC")
                         if quote_data is None:
                             raise Exception("Could not load token data for USDC (which should always be present).")
                         quote = Token(quote_data["symbol"], quote_data["name"], Decimal(
@@ -146,7 +149,7 @@ class SerumMarketLookup(MarketLookup):
                         market_address = PublicKey(market_address_string)
                         base = Token(token_data["symbol"], token_data["name"], Decimal(
                             token_data["decimals"]), PublicKey(token_data["address"]))
-                        quote_data = SerumMarketLookup._find_data_by_symbol("USDT", self.token_data)
+                        quote_data = self._find_data_by_symbol("USDT")
                         if quote_data is None:
                             raise Exception("Could not load token data for USDT (which should always be present).")
                         quote = Token(quote_data["symbol"], quote_data["name"], Decimal(
@@ -155,8 +158,8 @@ class SerumMarketLookup(MarketLookup):
         return None
 
     def all_markets(self) -> typing.Sequence[Market]:
-        usdt = SerumMarketLookup._find_token_by_symbol_or_error("USDT", self.token_data)
-        usdc = SerumMarketLookup._find_token_by_symbol_or_error("USDC", self.token_data)
+        usdt = self._find_token_by_symbol_or_error("USDT")
+        usdc = self._find_token_by_symbol_or_error("USDC")
 
         all_markets: typing.List[SerumMarketStub] = []
         for token_data in self.token_data["tokens"]:
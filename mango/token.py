@@ -29,17 +29,21 @@ class Instrument:
         self.name: str = name
         self.decimals: Decimal = decimals
 
+        # Deposits, borrows and order quantities shift between native and decimal form
+        # constantly, and raising 10 to a Decimal power on every shift goes through
+        # Decimal's slow exponentiation path. The scale never changes, so compute it once
+        # (via integer exponentiation) here.
+        self._native_scale: Decimal = Decimal(10 ** int(decimals))
+
     def round(self, value: Decimal) -> Decimal:
         return round(value, int(self.decimals))
 
     def shift_to_decimals(self, value: Decimal) -> Decimal:
-        divisor = Decimal(10 ** self.decimals)
-        shifted = value / divisor
+        shifted = value / self._native_scale
         return shifted
 
     def shift_to_native(self, value: Decimal) -> Decimal:
-        multiplier = Decimal(10 ** self.decimals)
-        shifted = value * multiplier
+        shifted = value * self._native_scale
         return round(shifted, 0)
 
     def symbol_matches(self, symbol: str) -> bool:
@@ -0,0 +1,12 @@
+import pytest
+
+from .context import mango
+from .fakes import fake_context
+
+
+# A fake Context is surprisingly expensive to build - it walks MangoConstants and sets up
+# a (mock) client - and no current test mutates it, so one per test run is plenty. Any
+# future test that does need to mutate a Context should call fake_context() directly.
+@pytest.fixture(scope="session")
+def context() -> mango.Context:
+    return fake_context()
@@ -3,6 +3,9 @@ import typing
 
 from .context import mango
 
+from decimal import Decimal
+from solana.rpc.api import Client
+from solana.rpc.commitment import Commitment
 from solana.rpc.types import RPCMethod, RPCResponse
 
 
@@ -156,3 +159,42 @@ def test_all_failing_raises_exception() -> None:
         actual.make_request(__FAKE_RPC_METHOD, "fake")
 
     assert actual.current == provider1
+
+
+class FakeBatchRPCCaller(mango.RPCCaller):
+    def __init__(self, lamports: int = 1000000000) -> None:
+        super().__init__("Fake", "https://localhost", [0.1, 0.2], mango.SlotHolder(), mango.InstructionReporter())
+        self.lamports = lamports
+        self.called = False
+
+    def make_batch_request(self, method: RPCMethod, params_list: typing.Sequence[typing.Sequence[typing.Any]]) -> typing.Sequence[RPCResponse]:
+        self.called = True
+        return [{
+            "jsonrpc": "2.0",
+            "id": counter,
+            "result": {"value": self.lamports + counter}
+        } for counter in range(len(params_list))]
+
+
+def test_batch_request_calls_first_provider() -> None:
+    provider1 = FakeBatchRPCCaller()
+    provider2 = FakeBatchRPCCaller()
+    actual = mango.CompoundRPCCaller("fake", [provider1, provider2])
+
+    responses = actual.make_batch_request(__FAKE_RPC_METHOD, [["fake1"], ["fake2"]])
+
+    assert len(responses) == 2
+    assert provider1.called
+    assert not provider2.called
+
+
+def test_get_balances_returns_in_request_order() -> None:
+    provider = FakeBatchRPCCaller()
+    compound = mango.CompoundRPCCaller("fake", [provider])
+    client = mango.BetterClient(Client("https://localhost"), "test", "local", Commitment("processed"),
+                                False, "base64", 0, compound)
+
+    balances = client.get_balances(["11111111111111111111111111111112", "11111111111111111111111111111113"])
+
+    assert balances == [Decimal(1000000000) / Decimal(10 ** 9),
+                        Decimal(1000000001) / Decimal(10 ** 9)]
@@ -1,3 +1,5 @@
+import pytest
+
 from .context import mango
 
 from decimal import Decimal
@@ -31,3 +33,41 @@ def test_new_from_cluster() -> None:
     assert derived.group_name == "devnet.2"
     assert derived.group_address == PublicKey("Ec2enZyoC4nGpEfu2sUNAa2nUGJHWxoUWYSEJ2hNTWTA")
     context_has_default_values(mango.ContextBuilder.default())
+
+
+def test_context_retry_pauses_are_jittered_backoff() -> None:
+    context = mango.ContextBuilder.default()
+    pauses = context.retry_pauses
+    assert len(pauses) == context.retry_attempts
+    for attempt, pause in enumerate(pauses):
+        base = Decimal(min(30, 2 ** (attempt + 2)))
+        assert pause >= base / 2
+        assert pause <= base * Decimal("1.5")
+
+
+def test_context_multiple_cluster_urls_from_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("CLUSTER_URL", "https://primary.example.com, https://fallback.example.com")
+    context = mango.ContextBuilder.build()
+    assert context.client.cluster_urls == ["https://primary.example.com", "https://fallback.example.com"]
+    assert context.client.cluster_url == "https://primary.example.com"
+
+
+def test_lookup_group_name() -> None:
+    context = mango.ContextBuilder.default()
+    assert context.lookup_group_name(PublicKey("98pjRuQjK3qA6gXts96PqZT4Ze5QmnCmt3QYjhbUSPue")) == "mainnet.1"
+    assert context.lookup_group_name(PublicKey("11111111111111111111111111111112")) == "« Unknown Group »"
+
+
+def test_fetch_concurrently_preserves_order() -> None:
+    context = mango.ContextBuilder.default()
+    results = context.fetch_concurrently([lambda: 1, lambda: 2, lambda: 3])
+    assert results == [1, 2, 3]
+
+
+def test_fetch_concurrently_propagates_exceptions() -> None:
+    def raiser() -> None:
+        raise Exception("fetch failed")
+
+    context = mango.ContextBuilder.default()
+    with pytest.raises(Exception):
+        context.fetch_concurrently([lambda: 1, raiser])
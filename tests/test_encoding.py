@@ -4,3 +4,11 @@ from .context import mango
 def test_decode_binary() -> None:
     data = mango.decode_binary(["SGVsbG8gV29ybGQ=", "base64"])  # "Hello World"
     assert len(data) == 11
+
+
+def test_fast_b58_round_trip() -> None:
+    from solana.publickey import PublicKey
+    address = "11111111111111111111111111111112"
+    decoded = mango.fast_b58decode(address)
+    assert decoded == bytes(PublicKey(address))
+    assert mango.fast_b58encode(decoded) == address
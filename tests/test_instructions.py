@@ -1,7 +1,7 @@
 import typing
 
 from .context import mango
-from .fakes import fake_context, fake_market, fake_seeded_public_key, fake_token, fake_wallet
+from .fakes import fake_market, fake_seeded_public_key, fake_token, fake_wallet
 
 from decimal import Decimal
 from pyserum.market.market import Market as PySerumMarket
@@ -9,8 +9,7 @@ from solana.publickey import PublicKey
 from solana.transaction import TransactionInstruction
 
 
-def test_build_create_spl_account_instructions() -> None:
-    context: mango.Context = fake_context()
+def test_build_create_spl_account_instructions(context: mango.Context) -> None:
     wallet: mango.Wallet = fake_wallet()
     token: mango.Token = fake_token()
     actual = mango.build_create_spl_account_instructions(context, wallet, token)
@@ -23,8 +22,7 @@ def test_build_create_spl_account_instructions() -> None:
     assert isinstance(actual.instructions[1], TransactionInstruction)
 
 
-def test_build_create_associated_spl_account_instructions() -> None:
-    context: mango.Context = fake_context()
+def test_build_create_associated_spl_account_instructions(context: mango.Context) -> None:
     wallet: mango.Wallet = fake_wallet()
     token: mango.Token = fake_token()
     actual = mango.build_create_associated_spl_account_instructions(context, wallet, token)
@@ -35,8 +33,7 @@ def test_build_create_associated_spl_account_instructions() -> None:
     assert isinstance(actual.instructions[0], TransactionInstruction)
 
 
-def test_build_transfer_spl_tokens_instructions() -> None:
-    context: mango.Context = fake_context()
+def test_build_transfer_spl_tokens_instructions(context: mango.Context) -> None:
     wallet: mango.Wallet = fake_wallet()
     token: mango.Token = fake_token()
     source: PublicKey = fake_seeded_public_key("source SPL account")
@@ -50,8 +47,7 @@ def test_build_transfer_spl_tokens_instructions() -> None:
     assert isinstance(actual.instructions[0], TransactionInstruction)
 
 
-def test_build_close_spl_account_instructions() -> None:
-    context: mango.Context = fake_context()
+def test_build_close_spl_account_instructions(context: mango.Context) -> None:
     wallet: mango.Wallet = fake_wallet()
     address: PublicKey = fake_seeded_public_key("target SPL account")
     actual = mango.build_close_spl_account_instructions(context, wallet, address)
@@ -62,8 +58,7 @@ def test_build_close_spl_account_instructions() -> None:
     assert isinstance(actual.instructions[0], TransactionInstruction)
 
 
-def test_build_create_serum_open_orders_instructions() -> None:
-    context: mango.Context = fake_context()
+def test_build_create_serum_open_orders_instructions(context: mango.Context) -> None:
     wallet: mango.Wallet = fake_wallet()
     market: PySerumMarket = fake_market()
     actual = mango.build_create_serum_open_orders_instructions(context, wallet, market)
@@ -74,8 +69,7 @@ def test_build_create_serum_open_orders_instructions() -> None:
     assert isinstance(actual.instructions[0], TransactionInstruction)
 
 
-def test_build_serum_place_order_instructions() -> None:
-    context: mango.Context = fake_context()
+def test_build_serum_place_order_instructions(context: mango.Context) -> None:
     wallet: mango.Wallet = fake_wallet()
     market: PySerumMarket = fake_market()
     source: PublicKey = fake_seeded_public_key("source")
@@ -95,8 +89,7 @@ def test_build_serum_place_order_instructions() -> None:
     assert isinstance(actual.instructions[0], TransactionInstruction)
 
 
-def test_build_serum_consume_events_instructions() -> None:
-    context: mango.Context = fake_context()
+def test_build_serum_consume_events_instructions(context: mango.Context) -> None:
     market_address: PublicKey = fake_seeded_public_key("market address")
     event_queue_address: PublicKey = fake_seeded_public_key("event queue address")
     open_orders_addresses: typing.Sequence[PublicKey] = [fake_seeded_public_key("open orders account")]
@@ -110,9 +103,8 @@ def test_build_serum_consume_events_instructions() -> None:
     assert isinstance(actual.instructions[0], TransactionInstruction)
 
 
-def test_build_serum_settle_instructions() -> None:
+def test_build_serum_settle_instructions(context: mango.Context) -> None:
     market = fake_market()
-    context: mango.Context = fake_context()
     wallet: mango.Wallet = fake_wallet()
     open_orders_address: PublicKey = fake_seeded_public_key("open orders account")
     base_token_account_address: PublicKey = fake_seeded_public_key("base token account")
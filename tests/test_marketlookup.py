@@ -190,3 +190,39 @@ def test_compound_lookups_with_full_data() -> None:
 
         non_existant_market = actual.find_by_symbol("ETH/BTC")
         assert non_existant_market is None  # No such market
+
+
+def test_ids_json_market_lookup_with_full_data() -> None:
+    instrument_lookup = mango.IdsJsonTokenLookup("devnet", "devnet.2")
+    market_lookup = mango.IdsJsonMarketLookup("devnet", instrument_lookup)
+
+    btc_perp = market_lookup.find_by_symbol("BTC-PERP")
+    assert btc_perp is not None
+    assert btc_perp.base.symbol == "BTC"
+    assert btc_perp.quote.symbol == "USDC"
+
+    btc_usdc = market_lookup.find_by_symbol("spot:BTC/USDC")
+    assert btc_usdc is not None
+    assert btc_usdc.base.symbol == "BTC"
+    assert btc_usdc.quote.symbol == "USDC"
+    assert btc_usdc.address == PublicKey("DW83EpHFywBxCHmyARxwj3nzxJd7MUdSeznmrdzZKNZB")
+
+    by_address = market_lookup.find_by_address(PublicKey("DW83EpHFywBxCHmyARxwj3nzxJd7MUdSeznmrdzZKNZB"))
+    assert by_address is not None
+    assert by_address.symbol == btc_usdc.symbol
+
+    non_existant_market = market_lookup.find_by_symbol("ETH/BTC")
+    assert non_existant_market is None  # No such market
+
+
+def test_ids_json_market_lookup_all_markets() -> None:
+    # Some perp markets (like ADA-PERP) have no SPL token, so this needs the non-SPL
+    # instruments too - the same combination ContextBuilder uses.
+    instrument_lookup = mango.CompoundInstrumentLookup([
+        mango.IdsJsonTokenLookup("devnet", "devnet.2"),
+        mango.NonSPLInstrumentLookup.load(mango.NonSPLInstrumentLookup.DefaultDevnetDataFilepath)])
+    market_lookup = mango.IdsJsonMarketLookup("devnet", instrument_lookup)
+
+    all_markets = market_lookup.all_markets()
+    # devnet.2 has 10 perp markets and 8 spot markets.
+    assert len(all_markets) == 18